@@ -1,5 +1,14 @@
+import random
+
 from django.conf import settings
-from django.template.loader import render_to_string
+
+from factory_generator.utils import render_template
+
+ROOT_DIR = getattr(settings, 'FACTORY_ROOT_DIR', 'model_factories')
+
+_MISSING = object()
+
+_IP_PROTOCOLS = ('ipv4', 'ipv6')
 
 
 class FieldFaker:
@@ -17,11 +26,30 @@ class FieldFaker:
     unquote_kwargs = []
     imports = []
     template = "factory_generator/default.py-tpl"
+    _resolved_kwargs = []
+    _static_provider = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Resolve once per class the name of the `get_[kwarg]` method
+        providing the value of each kwarg in `faker_kwargs`
+        """
+        super().__init_subclass__(**kwargs)
+        cls._resolved_kwargs = [
+            (kwarg, f"get_{kwarg}" if hasattr(cls, f"get_{kwarg}") else None)
+            for kwarg in cls.faker_kwargs
+        ]
+        # Most fakers only pass a static `provider`, render it without the generic loop
+        cls._static_provider = (
+            cls.faker_kwargs == ["provider"]
+            and not cls.unquote_kwargs
+            and not hasattr(cls, "get_provider")
+        )
 
     def __init__(self, model, field):
         self.model = model
         self.field = field
-        self.root_dir = getattr(settings, 'FACTORY_ROOT_DIR', 'model_factories')
+        self.root_dir = ROOT_DIR
         super(FieldFaker, self).__init__()
 
     @property
@@ -36,7 +64,7 @@ class FieldFaker:
         }
     
     def render(self):
-        return render_to_string(self.template, self.context)
+        return render_template(self.template, self.context)
 
     def get_faker_class(self):
         return self.faker_class
@@ -45,27 +73,26 @@ class FieldFaker:
         """
         Get kwargs for the faker instance
         """
-        if len(self.faker_kwargs) == 0:
+        if not self.faker_kwargs:
             return ''
-        kwargs = {}
-        for kwarg in self.faker_kwargs:
-            method = "get_{kwarg}".format(kwarg=kwarg)
-            if hasattr(self, method):
-                kwargs[kwarg] = getattr(self, method)()
-            else:
-                if hasattr(self, kwarg):
-                    kwargs[kwarg] = getattr(self, kwarg)
-                else:
-                    raise ValueError('Missing property `{kwarg}` or method `get_{kwarg}`for `{class_name}`'.format(
-                        class_name=self.__class__.__name__,
-                        kwarg=kwarg
-                    ))
+        if self._static_provider:
+            provider = getattr(self, "provider", _MISSING)
+            if provider is not _MISSING:
+                return f"provider={provider!r}"
         arr = []
-        for (key,val) in kwargs.items():
-            if key in self.unquote_kwargs:
-                arr.append("{!s}={!s}".format(key,val))
+        for kwarg, method_name in self._resolved_kwargs:
+            if method_name is not None:
+                value = getattr(self, method_name)()
             else:
-                arr.append("{!s}={!r}".format(key,val))
+                value = getattr(self, kwarg, _MISSING)
+            if value is _MISSING:
+                raise ValueError(
+                    f'Missing property `{kwarg}` or method `get_{kwarg}`for `{self.__class__.__name__}`'
+                )
+            if kwarg in self.unquote_kwargs:
+                arr.append(f"{kwarg!s}={value!s}")
+            else:
+                arr.append(f"{kwarg!s}={value!r}")
         return ', '.join(arr)
 
 
@@ -116,9 +143,7 @@ class ChoiceFieldFaker(FieldFaker):
     provider = "random_element"
 
     def get_elements(self):
-        return "{field_name}_CHOICES".format(
-            field_name = self.field.name.upper()
-        )
+        return f"{self.field.name.upper()}_CHOICES"
 
 
 class DateFieldFaker(FieldFaker):
@@ -212,11 +237,7 @@ class ForeignKeyFaker(FieldFaker):
     def get_factory(self):
         to = self.field.remote_field.model.__name__
         app_label = self.field.remote_field.model._meta.app_label
-        return "{root_dir}.{app_label}.{to}Factory".format(
-            root_dir=self.root_dir,
-            app_label=app_label,
-            to=to
-        )
+        return f"{self.root_dir}.{app_label}.{to}Factory"
 
 
 class ImageFieldFaker(FieldFaker):
@@ -241,10 +262,10 @@ class GenericIPAddressFieldFaker(FieldFaker):
 
     def get_provider(self):
         if self.field.protocol == 'both':
-            return random.choice(['ipv4', 'ipv6'])
+            return random.choice(_IP_PROTOCOLS)
         if self.field.protocol == 'IPv4':
             return 'ipv4'
-        if self.field.protocol == 'IPv4':
+        if self.field.protocol == 'IPv6':
             return 'ipv6'
 
 
@@ -267,11 +288,7 @@ class OneToOneFieldFaker(FieldFaker):
     def get_factory(self):
         to = self.field.remote_field.model.__name__
         app_label = self.field.remote_field.model._meta.app_label
-        return "{root_dir}.{app_label}.{to}Factory".format(
-            root_dir=self.root_dir,
-            app_label=app_label,
-            to=to
-        )
+        return f"{self.root_dir}.{app_label}.{to}Factory"
 
 
 class PositiveIntegerFieldFaker(FieldFaker):
@@ -1,22 +1,28 @@
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
 
 from django.conf import settings
-from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 
 from factory_generator import VERSION
-from factory_generator.fields_faker import FIELD_FAKER_MAP
-from factory_generator.utils import import_from_string
+from factory_generator.fields_faker import FIELD_FAKER_MAP, ROOT_DIR
+from factory_generator.utils import import_from_string, render_template
 
 NORMALIZE_FIELD_MAP = getattr(settings, 'FACTORY_NORMALIZE_FIELD_MAP', {})
 
 
-IGNORE_FIELDS = [
+IGNORE_FIELDS = frozenset([
     'ManyToOneRel',
     'ManyToManyRel',
     'OneToOneRel',
     'AutoField',
     'BigAutoField'
-] + getattr(settings, 'FACTORY_IGNORE_FIELDS', [])
+] + list(getattr(settings, 'FACTORY_IGNORE_FIELDS', [])))
+
+IGNORE_NON_EDITABLE_FIELDS = getattr(settings, 'FACTORY_IGNORE_NON_EDITABLE_FIELDS', True)
 
 
 class FactoryFieldGenerator:
@@ -29,21 +35,21 @@ class FactoryFieldGenerator:
     def __init__(self, field, model):
         self.field = field
         self.model = model
-        self.root_dir = getattr(settings, 'FACTORY_ROOT_DIR', 'model_factories')
+        self.root_dir = ROOT_DIR
         super(FactoryFieldGenerator, self).__init__()
 
-    @property
+    @cached_property
     def is_ignored(self):
         """
         Return `True` if the the field should be ignored to not appear in the factory class
         """
         if self.field_class in IGNORE_FIELDS:
             return True
-        if not self.field.editable and getattr(settings, 'FACTORY_IGNORE_NON_EDITABLE_FIELDS', True):
+        if not self.field.editable and IGNORE_NON_EDITABLE_FIELDS:
             return True
         return False
 
-    @property
+    @cached_property
     def field_faker_string(self):
         assert self.field_class in FIELD_FAKER_MAP,(
             'No FieldFaker defined for `%s`, specify a corresponding FieldFakerClass in `settings.FIELD_FAKER_MAP` or define a corresponding model in `settings.FACTORY_NORMALIZE_FIELD_MAP`' %
@@ -51,18 +57,25 @@ class FactoryFieldGenerator:
         )
         return FIELD_FAKER_MAP[self.field_class]
 
-    @property
+    @cached_property
     def field_faker_class(self):
         return import_from_string(self.field_faker_string)
 
-    @property
+    @cached_property
+    def faker(self):
+        """
+        Return the `FieldFaker` instance for the field
+        """
+        return self.field_faker_class(self.model, self.field)
+
+    @cached_property
     def has_choices(self):
         """
         Return `True` if the field has a `choices` attribute
         """
-        return hasattr(self.field, 'choices') and self.field.choices
+        return bool(getattr(self.field, 'choices', None))
 
-    @property
+    @cached_property
     def field_class(self):
         """
         Get the class of the field and normalize it to
@@ -75,30 +88,22 @@ class FactoryFieldGenerator:
             return NORMALIZE_FIELD_MAP[class_name]
         return class_name
 
-    @property
-    def base_context(self):
-        """
-        Return the context to render the base factory class
-        """
-        res = {
-            'field': self.field,
-            'model_name': self.model.__name__
-        }
-        return res
-
     def render_choices_list(self):
         """
         For a field that has a `choices` attribute
         render the list of choices
         """
-        return render_to_string('factory_generator/choiceslist.py-tpl', self.base_context)
+        field_name = self.field.name
+        return mark_safe(
+            f"{field_name.upper()}_CHOICES = "
+            f"[e[0] for e in {self.model.__name__}._meta.get_field('{field_name}').choices]"
+        )
 
     def render(self):
         """
         Render the appropriate template to get the field definition
         """
-        faker = self.field_faker_class(self.model, self.field)
-        return faker.render()
+        return self.faker.render()
 
 
 class PathMixin:
@@ -118,45 +123,45 @@ class PathMixin:
         Set the `root_dir` with the `FACTORY_DIR` settings or default
         to `model_factories`
         """
-        self.root_dir = getattr(settings, 'FACTORY_ROOT_DIR', 'model_factories')
+        self.root_dir = ROOT_DIR
         super(PathMixin, self).__init__()
 
-    @property
+    @cached_property
     def root_directory_path(self):
         """
         Return the root ./ directory full path
         """
         return os.path.join(settings.BASE_DIR, self.root_dir)
 
-    @property
+    @cached_property
     def root_init_file_path(self):
         """
         Return the root ./__init__.py file full path
         """
         return os.path.join(self.root_directory_path, '__init__.py')
 
-    @property
+    @cached_property
     def app_directory_path(self):
         """
         Return the ./app/ directory full path
         """
         return os.path.join(self.root_directory_path, self.app_label)
 
-    @property
+    @cached_property
     def app_init_file_path(self):
         """
         Return the ./app/__init__.py file full path
         """
         return os.path.join(self.app_directory_path, '__init__.py')
 
-    @property
+    @cached_property
     def app_base_directory_path(self):
         """
         Return the ./app/base/ directory full path
         """
-        return os.path.join(self.root_directory_path, self.app_label, 'base')
+        return os.path.join(self.app_directory_path, 'base')
 
-    @property
+    @cached_property
     def app_base_init_file_path(self):
         """
         Return the ./app/base/__init__.py file full path
@@ -180,41 +185,36 @@ class FactoryModelGenerator(PathMixin):
     def __init__(self, model):
         self.model = model
         self.app_label = model._meta.app_label  # needed for PathMixin
-        self.model_filename = "{filename}.py".format(
-            filename=self.model.__name__.lower())
+        self.model_filename = f"{self.model.__name__.lower()}.py"
         super(FactoryModelGenerator, self).__init__()
 
-    @property
+    @cached_property
     def fields(self):
         """
         Return the list of fields for the given model
         """
-        return [f for f in self.model._meta.get_fields()]
+        return list(self.model._meta.get_fields())
 
     @property
     def factory_name(self):
         """
         Return the class name for `[Model]Factory`
         """
-        return "{model_name}Factory".format(model_name=self.model.__name__)
+        return f"{self.model.__name__}Factory"
 
     @property
     def factory_base_name(self):
         """
         Return the class name for `[Model]FactoryBase`
         """
-        return "{factory_name}Base".format(factory_name=self.factory_name)
+        return f"{self.factory_name}Base"
 
     @property
     def context_init(self):
         """
         Get the context needed for the definition of the `__init__.py` file
         """
-        module_path = "{root_dir}.{app_label}.{model_lower}".format(
-            root_dir=self.root_dir,
-            app_label=self.model._meta.app_label,
-            model_lower=self.model.__name__.lower()
-        )
+        module_path = f"{self.root_dir}.{self.model._meta.app_label}.{self.model.__name__.lower()}"
         return {
             'module': module_path,
             'factory': self.factory_name
@@ -223,10 +223,10 @@ class FactoryModelGenerator(PathMixin):
     def get_import_string(self, import_str):
         arr = import_str.split('.')
         if len(arr) == 1:
-            return "import %s" % arr[0]
+            return f"import {arr[0]}"
         else:
             last_import = arr.pop()
-            return "from %s import %s" % ('.'.join(arr), last_import)
+            return f"from {'.'.join(arr)} import {last_import}"
 
     @property
     def context_base(self):
@@ -246,20 +246,21 @@ class FactoryModelGenerator(PathMixin):
             'unique_kwargs': ''
         }
         imports = []
+        model = self.model
         for field in self.fields:
-            factory = FactoryFieldGenerator(field, self.model)
+            factory = FactoryFieldGenerator(field, model)
             if factory.is_ignored:
                 continue
-            if hasattr(field, 'unique') and field.unique:
+            if getattr(field, 'unique', False):
                 res['unique'].append(field.name)
             if factory.has_choices:
                 res['choices'].append(factory.render_choices_list())
-            if factory.field_faker_class.imports:
-                imports += factory.field_faker_class.imports
+            field_faker_imports = factory.field_faker_class.imports
+            if field_faker_imports:
+                imports += field_faker_imports
             res['fields'].append(factory)
-            if res['unique']:
-                res['unique_kwargs'] = ', '.join(
-                    '%r' % key for key in res['unique']) + ','
+        if res['unique']:
+            res['unique_kwargs'] = ', '.join(map(repr, res['unique'])) + ','
         imports = list(set(imports))
         for import_ in imports:
             import_str = self.get_import_string(import_)
@@ -271,11 +272,7 @@ class FactoryModelGenerator(PathMixin):
         """
         Get the context needed for the definition of the `[Model]Factory` class
         """
-        factory_module_path = "{root_dir}.{app_label}.base.{model_lower}".format(
-            root_dir=self.root_dir,
-            app_label=self.model._meta.app_label,
-            model_lower=self.model.__name__.lower()
-        )
+        factory_module_path = f"{self.root_dir}.{self.model._meta.app_label}.base.{self.model.__name__.lower()}"
         res = {
             'model_name': self.model.__name__,
             'factory_module': factory_module_path,
@@ -285,43 +282,21 @@ class FactoryModelGenerator(PathMixin):
         }
         return res
 
-    def bootstrap_root_dir(self):
-        """
-        Create the directory defined in `FACTORY_DIR` (default to model_factories)
-        And create and empty `__init__.py` file to make this directory a python module
-        """
-        if not os.path.exists(self.root_directory_path):
-            os.makedirs(self.root_directory_path)
-            open(self.root_init_file_path, 'a').close()
-
-    def bootstrap_app_dirs(self):
-        """
-        Create the following directories and files for the app of the current model:
-        - app_directory_path:
-            - app_base_directory_path:
-                - app_base_init_file_path
-        """
-        if not os.path.exists(self.app_directory_path):
-            os.makedirs(self.app_directory_path)
-        if not os.path.exists(self.app_base_directory_path):
-            os.makedirs(self.app_base_directory_path)
-            open(self.app_base_init_file_path, 'a').close()
-
     @property
     def render_base(self):
         """
         Get the definition of the `[Model]FactoryBase` class
         """
-        return render_to_string('factory_generator/base-factory.py-tpl', self.context_base)
+        return render_template('factory_generator/base-factory.py-tpl', self.context_base)
 
     @property
     def render(self):
         """
         Get the definition of the `[Model]Factory` class
         """
-        return render_to_string('factory_generator/factory.py-tpl', self.context)
+        return render_template('factory_generator/factory.py-tpl', self.context)
 
-    @property
+    @cached_property
     def app_base_factory_file_path(self):
         """
         Return the factory file path, eg:
@@ -329,7 +304,7 @@ class FactoryModelGenerator(PathMixin):
         """
         return os.path.join(self.app_base_directory_path, self.model_filename)
 
-    @property
+    @cached_property
     def app_factory_file_path(self):
         """
         Return the factory file path, eg:
@@ -342,7 +317,8 @@ class FactoryModelGenerator(PathMixin):
         Create the file containing the `[Model]FactoryBase` class at the following path
         - model_factories/app/base/model.py
         """
-        with open(self.app_base_factory_file_path, 'w', encoding='utf-8') as base_factory_file:
+        with open(self.app_base_factory_file_path, 'w', buffering=io.DEFAULT_BUFFER_SIZE * 4,
+                  encoding='utf-8') as base_factory_file:
             base_factory_file.write(self.render_base)
 
     def create_factory_file(self):
@@ -350,16 +326,18 @@ class FactoryModelGenerator(PathMixin):
         Create the file containing the `[Model]Factory` class at the following path
         - model_factories/app/model.py
         """
-        if not os.path.exists(self.app_factory_file_path):
-            with open(self.app_factory_file_path, 'w', encoding='utf-8') as factory_file:
-                factory_file.write(self.render)
+        try:
+            factory_file = open(self.app_factory_file_path, 'x', encoding='utf-8')
+        except FileExistsError:
+            return
+        with factory_file:
+            factory_file.write(self.render)
 
     def create_files(self):
         """
-        Create factories files and directories for the given model
+        Create factories files for the given model, the app directories
+        are expected to exist (see `FactoryAppGenerator.bootstrap_dirs`)
         """
-        self.bootstrap_root_dir()
-        self.bootstrap_app_dirs()
         self.create_base_factory_file()
         self.create_factory_file()
 
@@ -377,11 +355,29 @@ class FactoryAppGenerator(PathMixin):
         self.app_label = app.label  # needed for PathMixin
         super(FactoryAppGenerator, self).__init__()
 
-    def render_init_file(self, context):
+    def bootstrap_dirs(self):
+        """
+        Create the following directories and files for the app, once for all its models:
+        - root_directory_path:
+            - root_init_file_path
+            - app_directory_path:
+                - app_base_directory_path:
+                    - app_base_init_file_path
+        """
+        os.makedirs(self.app_base_directory_path, exist_ok=True)
+        Path(self.root_init_file_path).touch()
+        Path(self.app_base_init_file_path).touch()
+
+    def render_init_file(self, imports):
         """
         Render the content of `__init__.py` file which imports all factories
         """
-        return render_to_string('factory_generator/app-init.py-tpl', context)
+        header = (
+            '"""\n'
+            f'Generated by `manage.py create_factories` using factory_generator {VERSION}. \n'
+            '"""\n\n'
+        )
+        return header + ''.join(f"from {i['module']} import {i['factory']}\n" for i in imports)
 
     def create_init_file(self, imports):
         """
@@ -389,10 +385,16 @@ class FactoryAppGenerator(PathMixin):
         """
         if imports:
             with open(self.app_init_file_path, 'w', encoding='utf-8') as init_file:
-                init_file.write(self.render_init_file({
-                    'imports': imports,
-                    'version': VERSION,
-                }))
+                init_file.write(self.render_init_file(imports))
+
+    def create_model_files(self, model):
+        """
+        Create factories files for a single model of the app and return
+        its `__init__.py` import context and the factory file path
+        """
+        factory_model_generator = FactoryModelGenerator(model)
+        factory_model_generator.create_files()
+        return factory_model_generator.context_init, factory_model_generator.app_factory_file_path
 
     def create_files(self):
         """
@@ -400,12 +402,15 @@ class FactoryAppGenerator(PathMixin):
         And once all factories for this app are generated, create
         the `__init__.py` file which import all factories
         """
+        models = list(self.app.get_models())
+        if not models:
+            return []
+        self.bootstrap_dirs()
         imports = []
         created_files = []
-        for model in self.app.get_models():
-            factory_model_generator = FactoryModelGenerator(model)
-            factory_model_generator.create_files()
-            imports.append(factory_model_generator.context_init)
-            created_files.append(factory_model_generator.app_factory_file_path)
+        with ThreadPoolExecutor(max_workers=min(32, len(models))) as executor:
+            for context_init, app_factory_file_path in executor.map(self.create_model_files, models):
+                imports.append(context_init)
+                created_files.append(app_factory_file_path)
         self.create_init_file(imports)
         return created_files
@@ -1,6 +1,7 @@
 import os
 
 from django.apps import apps
+from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from factory_generator.generator import FactoryAppGenerator
@@ -10,8 +11,14 @@ class Command(BaseCommand):
     help = 'Create model factories for all installed apps'
 
     def handle(self, *args, **options):
+        only_apps = frozenset(getattr(settings, 'FACTORY_ONLY_APPS', ()) or ())
+        ignore_apps = frozenset(getattr(settings, 'FACTORY_IGNORE_APPS', ()) or ())
         created_files = []
-        for app in apps.get_app_configs():
+        app_configs = [
+            app for app in apps.get_app_configs()
+            if (not only_apps or app.label in only_apps) and app.label not in ignore_apps
+        ]
+        for app in app_configs:
             factory_app_generator = FactoryAppGenerator(app)
             created_files += factory_app_generator.create_files()
         self.stdout.write(self.style.SUCCESS('Successfully created factories:'))
@@ -1,3 +1,105 @@
-from django.test import TestCase
+import ast
 
-# Create your tests here.
+from django.db import models
+from django.test import SimpleTestCase
+
+from factory_generator.fields_faker import FieldFaker, GenericIPAddressFieldFaker
+from factory_generator.generator import FactoryFieldGenerator, FactoryModelGenerator
+
+
+class Product(models.Model):
+    KIND_CHOICES = (
+        ('book', 'Book'),
+        ('music', 'Music'),
+    )
+    name = models.CharField(max_length=100)
+    ip_address = models.GenericIPAddressField()
+    ipv4_address = models.GenericIPAddressField(protocol='IPv4')
+    ipv6_address = models.GenericIPAddressField(protocol='IPv6')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+
+    class Meta:
+        app_label = 'factory_generator'
+
+
+class FactoryModelGeneratorTests(SimpleTestCase):
+
+    def test_render_choices_list(self):
+        factory = FactoryFieldGenerator(Product._meta.get_field('kind'), Product)
+        self.assertEqual(
+            factory.render_choices_list(),
+            "KIND_CHOICES = [e[0] for e in Product._meta.get_field('kind').choices]"
+        )
+
+    def test_render_base_with_choices_is_valid_python(self):
+        render_base = FactoryModelGenerator(Product).render_base
+        self.assertIn("KIND_CHOICES = [e[0] for e in Product._meta.get_field('kind').choices]", render_base)
+        ast.parse(render_base)
+
+
+class PropertyKwargFaker(FieldFaker):
+    faker_class = "factory.Faker"
+    faker_kwargs = ["provider", "max_chars"]
+    provider = "pystr"
+
+    @property
+    def max_chars(self):
+        return self.field.max_length
+
+
+class InstanceKwargFaker(FieldFaker):
+    faker_class = "factory.Faker"
+    faker_kwargs = ["provider", "locale"]
+    provider = "name"
+
+    def __init__(self, model, field):
+        super(InstanceKwargFaker, self).__init__(model, field)
+        self.locale = 'fr_FR'
+
+
+class StaticMethodKwargFaker(FieldFaker):
+    faker_class = "factory.Faker"
+    faker_kwargs = ["provider", "locale"]
+    provider = "name"
+
+    @staticmethod
+    def get_locale():
+        return 'fr_FR'
+
+
+class ClassMethodKwargFaker(FieldFaker):
+    faker_class = "factory.Faker"
+    faker_kwargs = ["provider"]
+
+    @classmethod
+    def get_provider(cls):
+        return "name"
+
+
+class FieldFakerTests(SimpleTestCase):
+
+    def test_kwarg_from_property(self):
+        faker = PropertyKwargFaker(Product, Product._meta.get_field('name'))
+        self.assertEqual(faker.get_faker_kwargs(), "provider='pystr', max_chars=100")
+
+    def test_kwarg_from_instance_attribute(self):
+        faker = InstanceKwargFaker(Product, Product._meta.get_field('name'))
+        self.assertEqual(faker.get_faker_kwargs(), "provider='name', locale='fr_FR'")
+
+    def test_kwarg_from_staticmethod(self):
+        faker = StaticMethodKwargFaker(Product, Product._meta.get_field('name'))
+        self.assertEqual(faker.get_faker_kwargs(), "provider='name', locale='fr_FR'")
+
+    def test_kwarg_from_classmethod(self):
+        faker = ClassMethodKwargFaker(Product, Product._meta.get_field('name'))
+        self.assertEqual(faker.get_faker_kwargs(), "provider='name'")
+
+    def test_generic_ip_address_provider(self):
+        for field_name, providers in (
+            ('ip_address', ("provider='ipv4'", "provider='ipv6'")),
+            ('ipv4_address', ("provider='ipv4'",)),
+            ('ipv6_address', ("provider='ipv6'",)),
+        ):
+            with self.subTest(field_name=field_name):
+                faker = GenericIPAddressFieldFaker(Product, Product._meta.get_field(field_name))
+                self.assertIn(faker.get_faker_kwargs(), providers)
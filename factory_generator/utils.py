@@ -1,6 +1,12 @@
+from functools import lru_cache
 from importlib import import_module
 
+from django.template.loader import get_template
 
+_TEMPLATE_CACHE = {}
+
+
+@lru_cache(maxsize=None)
 def import_from_string(val):
     """
     Attempt to import a class from a string representation.
@@ -11,5 +17,15 @@ def import_from_string(val):
         module = import_module(module_path)
         return getattr(module, class_name)
     except (ImportError, AttributeError) as e:
-        msg = "Could not import '%s' for setting. %s: %s." % (val, e.__class__.__name__, e)
-        raise ImportError(msg)
\ No newline at end of file
+        msg = f"Could not import '{val}' for setting. {e.__class__.__name__}: {e}."
+        raise ImportError(msg)
+
+
+def render_template(template_name, context):
+    """
+    Render a template, compiling it only the first time it is requested.
+    """
+    template = _TEMPLATE_CACHE.get(template_name)
+    if template is None:
+        template = _TEMPLATE_CACHE.setdefault(template_name, get_template(template_name))
+    return template.render(context)
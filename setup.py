@@ -28,26 +28,23 @@ setup(
         'Intended Audience :: Developers',
         'Topic :: Software Development :: Libraries :: Python Modules',
         'License :: OSI Approved :: MIT License',
-        'Framework :: Django :: 2.1',
-        'Framework :: Django :: 2.0',
-        'Framework :: Django :: 1.11',
-        'Framework :: Django :: 1.10',
-        'Framework :: Django :: 1.9',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.3',
-        'Programming Language :: Python :: 2.4',
-        'Programming Language :: Python :: 2.5',
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
+        'Framework :: Django :: 4.2',
+        'Framework :: Django :: 4.1',
+        'Framework :: Django :: 4.0',
+        'Framework :: Django :: 3.2',
+        'Framework :: Django :: 3.1',
+        'Framework :: Django :: 3.0',
+        'Framework :: Django :: 2.2',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.2',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
     ],
     keywords='python django factory_boy test',
     packages=find_packages(),
     include_package_data=True,
+    python_requires='>=3.8',
     install_requires=[],
 )